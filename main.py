@@ -3,73 +3,95 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import json
 import os
+import sys
+from typing import Any, Callable
 
-from tools.decision_eval import compare_prediction_with_market, run_prediction_for_date
-from tools.fusion_engine import short_term_signal_engine
-from tools.market_data import get_market_sentiment, get_sector_rotation, scan_strong_stocks
-from tools.money_flow import analyze_capital_flow
-from tools.reporting import generate_daily_report
-from tools.risk_control import short_term_risk_control
+from tools.debug_utils import refresh_env_debug
+from tools.output import round_output
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 def _print(data: object) -> None:
-    print(json.dumps(data, ensure_ascii=False, indent=2))
+    data = round_output(data)
+    if orjson is None:
+        print(json.dumps(data, ensure_ascii=False, indent=2))
+        return
+    # orjson encodes in C and writes UTF-8 directly, matching ensure_ascii=False.
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=option))
+    sys.stdout.buffer.flush()
+
+
+# Only the selected tool's module is imported, so pure tools skip the pandas/akshare import cost.
+TOOL_MAP = {
+    "get_market_sentiment": ("tools.market_data", "get_market_sentiment"),
+    "get_sector_rotation": ("tools.market_data", "get_sector_rotation"),
+    "scan_strong_stocks": ("tools.market_data", "scan_strong_stocks"),
+    "analyze_capital_flow": ("tools.money_flow", "analyze_capital_flow"),
+    "short_term_signal_engine": ("tools.fusion_engine", "short_term_signal_engine"),
+    "short_term_risk_control": ("tools.risk_control", "short_term_risk_control"),
+    "generate_daily_report": ("tools.reporting", "generate_daily_report"),
+    "run_prediction_for_date": ("tools.decision_eval", "run_prediction_for_date"),
+    "compare_prediction_with_market": ("tools.decision_eval", "compare_prediction_with_market"),
+}
+
+
+def _load_tool(name: str) -> Callable[..., Any]:
+    module_path, func_name = TOOL_MAP[name]
+    return getattr(importlib.import_module(module_path), func_name)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="A-share short-term decision tools")
-    parser.add_argument(
-        "tool",
-        choices=[
-            "get_market_sentiment",
-            "get_sector_rotation",
-            "scan_strong_stocks",
-            "analyze_capital_flow",
-            "short_term_signal_engine",
-            "short_term_risk_control",
-            "generate_daily_report",
-            "run_prediction_for_date",
-            "compare_prediction_with_market",
-        ],
-    )
+    parser.add_argument("tool", choices=list(TOOL_MAP))
     parser.add_argument("--symbol", default=None, help="stock symbol for capital flow tool")
     parser.add_argument("--score", type=float, default=50, help="market sentiment score for risk control tool")
     parser.add_argument("--date", default=None, help="analysis date, format YYYY-MM-DD or YYYYMMDD")
     parser.add_argument("--prediction-date", default=None, help="prediction date for comparison, format YYYY-MM-DD")
     parser.add_argument("--actual-date", default=None, help="actual comparison date, format YYYY-MM-DD")
     parser.add_argument("--debug", action="store_true", help="enable debug_info in outputs")
+    parser.add_argument(
+        "--force-full",
+        action="store_true",
+        help="run sector/stock/capital steps of the signal engine even when the market filter blocks trading",
+    )
     args = parser.parse_args()
 
     debug = bool(args.debug)
     if debug:
         os.environ["SHORT_DECISION_DEBUG"] = "1"
+        refresh_env_debug()
+
+    if args.tool == "run_prediction_for_date" and not args.date:
+        raise SystemExit("--date is required for run_prediction_for_date")
+    pred_date = args.prediction_date or args.date
+    if args.tool == "compare_prediction_with_market" and not pred_date:
+        raise SystemExit("--prediction-date (or --date) is required for compare_prediction_with_market")
+    if args.force_full and args.tool != "short_term_signal_engine":
+        raise SystemExit("--force-full only applies to short_term_signal_engine")
 
-    if args.tool == "get_market_sentiment":
-        _print(get_market_sentiment(analysis_date=args.date, debug=debug))
-    elif args.tool == "get_sector_rotation":
-        _print(get_sector_rotation(analysis_date=args.date, debug=debug))
-    elif args.tool == "scan_strong_stocks":
-        _print(scan_strong_stocks(analysis_date=args.date, debug=debug))
+    tool = _load_tool(args.tool)
+    if args.tool in ("get_market_sentiment", "get_sector_rotation", "scan_strong_stocks", "generate_daily_report"):
+        _print(tool(analysis_date=args.date, debug=debug))
     elif args.tool == "analyze_capital_flow":
-        _print(analyze_capital_flow(symbol=args.symbol, analysis_date=args.date, debug=debug))
+        _print(tool(symbol=args.symbol, analysis_date=args.date, debug=debug))
     elif args.tool == "short_term_signal_engine":
-        _print(short_term_signal_engine(analysis_date=args.date, debug=debug))
+        _print(tool(analysis_date=args.date, debug=debug, force_full=args.force_full))
     elif args.tool == "short_term_risk_control":
-        _print(short_term_risk_control(args.score))
-    elif args.tool == "generate_daily_report":
-        _print(generate_daily_report(analysis_date=args.date, debug=debug))
+        _print(tool(args.score))
     elif args.tool == "run_prediction_for_date":
-        if not args.date:
-            raise SystemExit("--date is required for run_prediction_for_date")
-        _print(run_prediction_for_date(analysis_date=args.date, debug=debug))
+        _print(tool(analysis_date=args.date, debug=debug))
     else:
-        pred_date = args.prediction_date or args.date
-        if not pred_date:
-            raise SystemExit("--prediction-date (or --date) is required for compare_prediction_with_market")
         _print(
-            compare_prediction_with_market(
+            tool(
                 prediction_date=pred_date,
                 actual_date=args.actual_date,
                 auto_generate_if_missing=True,
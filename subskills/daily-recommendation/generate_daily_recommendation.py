@@ -15,10 +15,11 @@ DATA_DIR = ROOT / "data"
 sys.path.insert(0, str(ROOT))
 
 from tools.fusion_engine import short_term_signal_engine  # noqa: E402
+from tools.output import round_output  # noqa: E402
 
 
 def save_json(path: Path, payload: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_text(json.dumps(round_output(payload), ensure_ascii=False, indent=2), encoding="utf-8")
 
 
 def main() -> None:
@@ -29,7 +30,8 @@ def main() -> None:
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    signal = short_term_signal_engine(analysis_date=args.date)
+    # The artifact lists the screener's picks even when the market filter blocks trading.
+    signal = short_term_signal_engine(analysis_date=args.date, force_full=True)
     candidates = signal.get("candidates", [])[: max(args.top_n, 0)]
 
     report = {
@@ -1,20 +1,42 @@
 ﻿"""A-share short-term decision tools package."""
 
-from .decision_eval import compare_prediction_with_market, run_prediction_for_date
-from .fusion_engine import short_term_signal_engine
-from .market_data import get_market_sentiment, get_sector_rotation, scan_strong_stocks
-from .money_flow import analyze_capital_flow
-from .reporting import generate_daily_report
-from .risk_control import short_term_risk_control
-
-__all__ = [
-    "get_market_sentiment",
-    "get_sector_rotation",
-    "scan_strong_stocks",
-    "analyze_capital_flow",
-    "short_term_signal_engine",
-    "short_term_risk_control",
-    "generate_daily_report",
-    "run_prediction_for_date",
-    "compare_prediction_with_market",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .decision_eval import compare_prediction_with_market, run_prediction_for_date
+    from .fusion_engine import short_term_signal_engine
+    from .market_data import get_market_sentiment, get_sector_rotation, scan_strong_stocks
+    from .money_flow import analyze_capital_flow
+    from .reporting import generate_daily_report
+    from .risk_control import short_term_risk_control
+
+# Tools load on first attribute access so importing the package does not pull in pandas/akshare.
+_LAZY_TOOLS = {
+    "get_market_sentiment": ".market_data",
+    "get_sector_rotation": ".market_data",
+    "scan_strong_stocks": ".market_data",
+    "analyze_capital_flow": ".money_flow",
+    "short_term_signal_engine": ".fusion_engine",
+    "short_term_risk_control": ".risk_control",
+    "generate_daily_report": ".reporting",
+    "run_prediction_for_date": ".decision_eval",
+    "compare_prediction_with_market": ".decision_eval",
+}
+
+__all__ = list(_LAZY_TOOLS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_TOOLS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
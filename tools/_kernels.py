@@ -0,0 +1,94 @@
+"""Numeric kernels for the stock scanner; JIT-compiled with numba only when enabled."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+# At most a few hundred calls per scan, each microseconds in plain Python: importing and
+# compiling numba costs more than it saves for a CLI run, so the JIT is opt-in.
+_JIT_KERNEL: Callable | None = None
+
+
+def is_jit_enabled(default: bool = False) -> bool:
+    """
+    Resolve numba JIT behavior for the scanner kernels.
+
+    Priority:
+    1) env SHORT_DECISION_JIT_ENABLED
+    2) config.json runtime.jit_enabled
+    3) default
+    """
+    raw = os.getenv("SHORT_DECISION_JIT_ENABLED", "").strip().lower()
+    if raw in ("1", "true", "yes", "on"):
+        return True
+    if raw in ("0", "false", "no", "off"):
+        return False
+
+    try:
+        cfg_path = Path(__file__).resolve().parents[1] / "config.json"
+        cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+        return bool(cfg.get("runtime", {}).get("jit_enabled", default))
+    except Exception:
+        return default
+
+
+def evaluate_candidate(
+    closes,
+    opens,
+    volumes,
+    trend_lookback,
+    baseline_days,
+    min_volume_ratio,
+    bearish_drop_pct,
+    bearish_volume_ratio,
+):
+    """
+    Run the per-symbol screener checks on daily bars (oldest first).
+
+    Mirrors `indicators.trend_up` and `indicators.volume_ratio`:
+    - latest `trend_lookback` closes strictly rising
+    - last volume over the mean of the previous `baseline_days` volumes above `min_volume_ratio`
+    - not a high-volume bearish candle
+
+    Returns (accept, vol_ratio, last_day_change_pct).
+    """
+    n = closes.shape[0]
+    if n == 0 or n < trend_lookback:
+        return False, 0.0, 0.0
+
+    start = n - trend_lookback if trend_lookback > 0 else 0
+    for idx in range(start + 1, n):
+        if closes[idx] <= closes[idx - 1]:
+            return False, 0.0, 0.0
+
+    lo = max(n - (baseline_days + 1), 0)
+    total = 0.0
+    for idx in range(lo, n - 1):
+        total += volumes[idx]
+    baseline = total / max(n - 1 - lo, 1)
+    vol_ratio = volumes[n - 1] / baseline if baseline > 0 else 0.0
+    if vol_ratio <= min_volume_ratio:
+        return False, vol_ratio, 0.0
+
+    prev_close = closes[n - 2] if n > 1 else 0.0
+    last_change = (closes[n - 1] - prev_close) / prev_close * 100 if prev_close else 0.0
+    if opens[n - 1] > closes[n - 1] and last_change < bearish_drop_pct and vol_ratio > bearish_volume_ratio:
+        return False, vol_ratio, last_change
+    return True, vol_ratio, last_change
+
+
+def candidate_kernel() -> Callable:
+    """`evaluate_candidate`, compiled on first use when the JIT is enabled and numba is installed."""
+    global _JIT_KERNEL
+    if not is_jit_enabled():
+        return evaluate_candidate
+    if _JIT_KERNEL is None:
+        try:
+            from numba import njit  # type: ignore
+        except Exception:  # pragma: no cover
+            return evaluate_candidate
+        _JIT_KERNEL = njit(cache=True)(evaluate_candidate)
+    return _JIT_KERNEL
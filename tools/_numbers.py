@@ -0,0 +1,58 @@
+﻿"""Amount parsing shared by the market-data and capital-flow tools (万/亿 units, thousands separators)."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+try:
+    import pandas as pd
+except Exception:  # pragma: no cover
+    pd = None  # type: ignore
+
+UNIT_RE = re.compile(r"(-?\d+(?:\.\d+)?)([万亿]?)")
+UNIT_SCALE = {"万": 10_000.0, "亿": 100_000_000.0, "": 1.0}
+
+
+def normalize_number(value: Any) -> float:
+    # bool is an int subclass, but a flag is not an amount.
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        out = float(value)
+        return out if math.isfinite(out) else 0.0
+    if value is None:
+        return 0.0
+    text = str(value).strip().replace(",", "")
+    match = UNIT_RE.fullmatch(text)
+    if match:
+        out = float(match.group(1)) * UNIT_SCALE[match.group(2)]
+        return out if math.isfinite(out) else 0.0
+
+    # Rare shapes ("+1.5亿", "1e8", "-", "--") take the slow path.
+    unit = UNIT_SCALE.get(text[-1:], 1.0)
+    if unit != 1.0:
+        text = text[:-1]
+    try:
+        out = float(text) * unit
+        return out if math.isfinite(out) else 0.0
+    except Exception:
+        return 0.0
+
+
+def vec_normalize(series: Any) -> Any:
+    """Column-wise `normalize_number`: numeric dtypes pass through, strings honour 万/亿 units."""
+    if pd.api.types.is_numeric_dtype(series):
+        values = pd.to_numeric(series, errors="coerce").astype(np.float64)
+    else:
+        text = series.astype(str).str.strip().str.replace(",", "", regex=False)
+        parts = text.str.extract(f"^{UNIT_RE.pattern}$")
+        values = pd.to_numeric(parts[0], errors="coerce") * parts[1].map(UNIT_SCALE)
+        misses = values.isna() & series.notna()
+        if misses.any():
+            values[misses] = series[misses].map(normalize_number)
+    return values.replace([np.inf, -np.inf], np.nan).fillna(0.0)
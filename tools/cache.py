@@ -0,0 +1,223 @@
+﻿"""Disk cache for akshare DataFrame responses."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from datetime import date, datetime, time as dtime, timedelta
+from typing import Any, Callable, Union
+
+try:
+    import pandas as pd
+except Exception:  # pragma: no cover
+    pd = None  # type: ignore
+
+CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache"
+
+# Realtime snapshots (spot table, board lists) change every few seconds during the session.
+INTRADAY_TTL = 300.0
+
+# Forward-adjusted (qfq) bars are rewritten after every ex-dividend event, so closed days expire too.
+QFQ_TTL = 24 * 3600.0
+
+# Entries untouched this long are deleted the first time their endpoint is written in a process.
+PRUNE_AFTER = 7 * 24 * 3600.0
+
+SESSION_CLOSE = dtime(15, 0)
+
+# Freshness: max age in seconds, None (never expires), or a predicate on the entry's write time.
+TTL = Union[float, None, Callable[[float], bool]]
+
+
+def is_cache_enabled(default: bool = True) -> bool:
+    """
+    Resolve disk cache behavior.
+
+    Priority:
+    1) env SHORT_DECISION_CACHE_ENABLED
+    2) config.json data_source.cache_enabled
+    3) default
+    """
+    raw = os.getenv("SHORT_DECISION_CACHE_ENABLED", "").strip().lower()
+    if raw in ("1", "true", "yes", "on"):
+        return True
+    if raw in ("0", "false", "no", "off"):
+        return False
+
+    try:
+        cfg_path = Path(__file__).resolve().parents[1] / "config.json"
+        cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+        return bool(cfg.get("data_source", {}).get("cache_enabled", default))
+    except Exception:
+        return default
+
+
+def ttl_for_trade_day(ymd: str, max_age: float | None = None) -> Callable[[float], bool]:
+    """
+    Freshness for data about trading day `ymd`, judged by when the entry was written.
+
+    Entries written after that day's close are final (bounded by `max_age` when given); earlier
+    ones hold partial session data and only live `INTRADAY_TTL` until the close.
+    """
+    close_ts = datetime.combine(datetime.strptime(ymd, "%Y%m%d").date(), SESSION_CLOSE).timestamp()
+
+    def fresh(written_at: float) -> bool:
+        now = time.time()
+        if max_age is not None and now - written_at > max_age:
+            return False
+        if written_at >= close_ts:
+            return True
+        return now < close_ts and now - written_at <= INTRADAY_TTL
+
+    return fresh
+
+
+def _is_fresh(written_at: float, ttl: TTL) -> bool:
+    if ttl is None:
+        return True
+    if callable(ttl):
+        return bool(ttl(written_at))
+    return time.time() - written_at <= ttl
+
+
+def _column_kinds(frame: Any) -> dict[str, str]:
+    """Columns whose values JSON would flatten to ISO strings: datetime64 and `datetime.date` cells."""
+    kinds: dict[str, str] = {}
+    for col in frame.columns:
+        series = frame[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            kinds[str(col)] = "datetime"
+        elif series.dtype == object:
+            values = series.dropna()
+            if len(values) and all(isinstance(v, date) and not isinstance(v, datetime) for v in values):
+                kinds[str(col)] = "date"
+    return kinds
+
+
+def _restore_kinds(frame: Any, kinds: dict[str, str]) -> Any:
+    for col, kind in kinds.items():
+        if col not in frame.columns:
+            continue
+        parsed = pd.to_datetime(frame[col], errors="coerce")
+        frame[col] = parsed.dt.date if kind == "date" else parsed
+    return frame
+
+
+def in_trading_session(now: datetime | None = None) -> bool:
+    """Weekday 09:15-15:00 local time, auction included; exchange holidays are not modelled."""
+    now = now or datetime.now()
+    return now.weekday() < 5 and dtime(9, 15) <= now.time() < SESSION_CLOSE
+
+
+def last_session_close(now: datetime | None = None) -> datetime:
+    """Most recent weekday 15:00 at or before `now`; exchange holidays are not modelled."""
+    now = now or datetime.now()
+    day = now.date()
+    if now.time() < SESSION_CLOSE:
+        day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return datetime.combine(day, SESSION_CLOSE)
+
+
+class FileCache:
+    """Store DataFrames as `<root>/<endpoint>/<md5(params)>.json` with a `{"ts", "payload"}` envelope."""
+
+    def __init__(self, root: Path = CACHE_DIR) -> None:
+        self.root = Path(root)
+        self._pruned: set[str] = set()
+
+    def _path(self, endpoint: str, params: dict[str, Any]) -> Path:
+        raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+        return self.root / endpoint / f"{digest}.json"
+
+    def get(self, endpoint: str, params: dict[str, Any], ttl: TTL = None) -> Any:
+        path = self._path(endpoint, params)
+        try:
+            envelope = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if not _is_fresh(float(envelope.get("ts", 0)), ttl):
+            return None
+        payload = envelope.get("payload") or {}
+        frame = pd.DataFrame(payload.get("data", []), columns=payload.get("columns", []))
+        return _restore_kinds(frame, envelope.get("kinds") or {})
+
+    def set(self, endpoint: str, params: dict[str, Any], frame: Any) -> None:
+        path = self._path(endpoint, params)
+        # double_precision defaults to 10 digits, which would perturb raw prices on a cache hit.
+        raw = frame.to_json(orient="split", index=False, date_format="iso", force_ascii=False, double_precision=15)
+        payload = json.loads(raw)
+        envelope = {"ts": time.time(), "endpoint": endpoint, "params": params, "kinds": _column_kinds(frame), "payload": payload}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename keeps concurrent readers from seeing a partial file.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(envelope, f, ensure_ascii=False, default=str)
+            os.replace(tmp, path)
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def prune(self, endpoint: str, max_age: float = PRUNE_AFTER) -> int:
+        """Delete `endpoint` entries last written more than `max_age` seconds ago."""
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in (self.root / endpoint).glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def get_or_fetch(
+        self, endpoint: str, params: dict[str, Any], fetch: Callable[[], Any], ttl: TTL = INTRADAY_TTL
+    ) -> Any:
+        """Return the cached frame when fresh, else call `fetch` and store non-empty results."""
+        if pd is None or not is_cache_enabled():
+            return fetch()
+        cached = self.get(endpoint, params, ttl=ttl)
+        if cached is not None:
+            return cached
+        frame = fetch()
+        if isinstance(frame, pd.DataFrame) and not frame.empty:
+            try:
+                self.set(endpoint, params, frame)
+                # Keys embed dates, so old entries are never overwritten; sweep each endpoint once per process.
+                if endpoint not in self._pruned:
+                    self._pruned.add(endpoint)
+                    self.prune(endpoint)
+            except Exception:
+                # A failed write only costs a refetch next time; never fail the live call.
+                pass
+        return frame
+
+
+default_cache = FileCache()
+
+
+def cached(api: str, ttl: TTL = INTRADAY_TTL, cache: FileCache | None = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Serve a keyword-only fetcher through the disk cache under `api`.
+
+    A callable `ttl` receives each entry's write time, so freshness can depend on the trading session.
+    """
+
+    def decorator(fetch: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fetch)
+        def wrapper(**params: Any) -> Any:
+            store = cache or default_cache
+            return store.get_or_fetch(api, params, lambda: fetch(**params), ttl=ttl)
+
+        return wrapper
+
+    return decorator
@@ -8,13 +8,26 @@ from pathlib import Path
 from typing import Any
 
 
-def resolve_debug(debug: bool = False) -> bool:
-    if debug:
-        return True
+def _read_env_debug() -> bool:
     raw = os.getenv("SHORT_DECISION_DEBUG", "").strip().lower()
     return raw in ("1", "true", "yes", "on")
 
 
+# Read once at import; every public tool consults it, often several times per engine run.
+_ENV_DEBUG = _read_env_debug()
+
+
+def refresh_env_debug() -> bool:
+    """Re-read SHORT_DECISION_DEBUG after the environment changed at runtime."""
+    global _ENV_DEBUG
+    _ENV_DEBUG = _read_env_debug()
+    return _ENV_DEBUG
+
+
+def resolve_debug(debug: bool = False) -> bool:
+    return debug or _ENV_DEBUG
+
+
 def with_debug(payload: dict[str, Any], debug: bool, debug_info: dict[str, Any]) -> dict[str, Any]:
     if not debug:
         return payload
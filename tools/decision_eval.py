@@ -18,6 +18,7 @@ except Exception:  # pragma: no cover
     ak = None  # type: ignore
 
 from .fusion_engine import short_term_signal_engine
+from .output import round_output
 
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 LOG_PATH = DATA_DIR / "decision_log.jsonl"
@@ -30,7 +31,7 @@ def _ensure_data_dir() -> None:
 def _append_jsonl(path: Path, item: dict[str, Any]) -> None:
     _ensure_data_dir()
     with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        f.write(json.dumps(round_output(item), ensure_ascii=False) + "\n")
 
 
 def _load_entries(path: Path) -> list[dict[str, Any]]:
@@ -50,7 +51,8 @@ def _load_entries(path: Path) -> list[dict[str, Any]]:
 
 
 def run_prediction_for_date(analysis_date: str, debug: bool = False) -> dict[str, Any]:
-    signal = short_term_signal_engine(analysis_date=analysis_date, debug=debug)
+    # Logged picks are evaluated later even on blocked days, so never take the NO_TRADE shortcut.
+    signal = short_term_signal_engine(analysis_date=analysis_date, debug=debug, force_full=True)
     entry = {
         "logged_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "analysis_date": signal.get("analysis_date", analysis_date),
@@ -72,12 +74,12 @@ def _pick_entry(entries: list[dict[str, Any]], analysis_date: str) -> dict[str,
     return None
 
 
-def _to_records(frame: Any) -> list[dict[str, Any]]:
-    if frame is None or pd is None:
-        return []
-    if not isinstance(frame, pd.DataFrame) or frame.empty:
-        return []
-    return frame.to_dict(orient="records")
+def _first_last_rows(frame: Any) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """First and last rows as dicts, or None when there are fewer than two rows."""
+    if pd is None or not isinstance(frame, pd.DataFrame) or len(frame) < 2:
+        return None
+    first, last = frame.iloc[[0, -1]].to_dict(orient="records")
+    return first, last
 
 
 def _num(row: dict[str, Any], keys: list[str], default: float = 0.0) -> float:
@@ -154,11 +156,11 @@ def compare_prediction_with_market(
             continue
         try:
             hist = ak.stock_zh_a_hist(symbol=code, period="daily", start_date=pred_ymd, end_date=actual_ymd, adjust="qfq")
-            rows = _to_records(hist)
+            ends = _first_last_rows(hist)
         except Exception:
-            rows = []
+            ends = None
 
-        if len(rows) < 2:
+        if ends is None:
             comparison.append(
                 {
                     "code": code,
@@ -169,8 +171,7 @@ def compare_prediction_with_market(
             )
             continue
 
-        first = rows[0]
-        last = rows[-1]
+        first, last = ends
         buy_px = _num(first, ["收盘"], 0.0)
         sell_px = _num(last, ["收盘"], 0.0)
         ret = ((sell_px - buy_px) / buy_px * 100.0) if buy_px else 0.0
@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from typing import Any, Dict, List
 
 from .debug_utils import resolve_debug, with_debug
 from .indicators import clamp
-from .market_data import get_market_sentiment, get_sector_rotation, scan_strong_stocks
+from .market_data import get_market_sentiment, get_sector_rotation, load_spot_frame, scan_strong_stocks
 from .money_flow import analyze_capital_flow
 from .risk_control import short_term_risk_control
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+# Factor order: sentiment, sector, stock volume, capital inflow, technical structure.
+_WEIGHT_VALUES = (0.25, 0.25, 0.20, 0.20, 0.10)
+_WEIGHTS = np.array(_WEIGHT_VALUES) if np is not None else None
+
+
+@dataclass
+class Context:
+    """Data shared by the tool calls of a single engine run."""
+
+    spot_df: Any = None
+    chosen_date: str = ""
+    # Resolved once so sub-calls agree on "today" even if the run straddles midnight.
+    today: date = field(default_factory=lambda: datetime.now().date())
+
 
 def _calc_sector_score(top_sectors: List[dict[str, Any]]) -> float:
     if not top_sectors:
@@ -42,6 +63,19 @@ def _calc_technical_score(stocks: List[dict[str, Any]]) -> float:
     return clamp(55 + ratio * 10, 0, 100)
 
 
+def _weighted_score(factors: Any) -> Any:
+    """
+    Clamp the weighted factor sum to [0, 100].
+
+    `factors` is one row of the five factor scores, or an [N, 5] array for batch
+    evaluation (returns N scores).
+    """
+    if np is None:
+        return clamp(sum(w * float(f) for w, f in zip(_WEIGHT_VALUES, factors)), 0, 100)
+    scores = np.clip(np.asarray(factors, dtype=np.float64) @ _WEIGHTS, 0, 100)
+    return float(scores) if scores.ndim == 0 else scores
+
+
 def _build_no_recommendation_message(
     signal: str,
     stocks: List[dict[str, Any]],
@@ -59,31 +93,63 @@ def _build_no_recommendation_message(
     return "当前不满足短线开仓条件，建议观望。"
 
 
-def short_term_signal_engine(analysis_date: str | None = None, debug: bool = False) -> Dict[str, Any]:
-    """Build weighted short-term signal."""
+def _skipped_capital_flow() -> dict[str, Any]:
+    return {
+        "symbol": "market",
+        "main_flow": 0,
+        "northbound_net": 0,
+        "northbound_inflow_days": 0,
+        "flow_trend": "unknown",
+        "strength_rank": 100,
+        "data_source": "skipped",
+    }
+
+
+def short_term_signal_engine(
+    analysis_date: str | None = None,
+    debug: bool = False,
+    force_full: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build weighted short-term signal.
+
+    When the market filter blocks new positions the result is NO_TRADE regardless of
+    sectors, stocks or capital flow, so those fetches are skipped unless `debug` or
+    `force_full` asks for the complete picture.
+    """
     debug = resolve_debug(debug)
-    sentiment = get_market_sentiment(analysis_date=analysis_date, debug=debug)
-    sector_info = get_sector_rotation(top_n=5, analysis_date=analysis_date, debug=debug)
-    sector_names = [x["name"] for x in sector_info.get("top_sectors", [])]
-    stocks = scan_strong_stocks(sectors=sector_names, top_n=5, analysis_date=analysis_date, debug=debug)
+    ctx = Context(spot_df=load_spot_frame())
+    sentiment = get_market_sentiment(analysis_date=analysis_date, debug=debug, ctx=ctx)
+    sentiment_score = float(sentiment.get("market_sentiment_score", 0.0))
+    risk = short_term_risk_control(sentiment_score)
+
+    short_circuit = not risk["market_filter"] and sentiment_score < 40 and not (debug or force_full)
+    if short_circuit:
+        sector_info: dict[str, Any] = {"top_sectors": [], "data_source": "skipped"}
+        stocks: List[dict[str, Any]] = []
+        capital = _skipped_capital_flow()
+    else:
+        sector_info = get_sector_rotation(top_n=5, analysis_date=analysis_date, debug=debug, ctx=ctx)
+        sector_names = [x["name"] for x in sector_info.get("top_sectors", [])]
+        stocks = scan_strong_stocks(
+            sectors=sector_names,
+            top_n=5,
+            analysis_date=analysis_date,
+            debug=debug,
+            ctx=ctx,
+            board_type=sector_info.get("board_type", "industry"),
+        )
+        capital = analyze_capital_flow(
+            symbol=stocks[0]["code"] if stocks else None, analysis_date=analysis_date, debug=debug, today=ctx.today
+        )
     target_symbol = stocks[0]["code"] if stocks else None
-    capital = analyze_capital_flow(symbol=target_symbol, analysis_date=analysis_date, debug=debug)
-    risk = short_term_risk_control(float(sentiment.get("market_sentiment_score", 0.0)))
 
-    sentiment_score = float(sentiment.get("market_sentiment_score", 0.0))
     sector_score = _calc_sector_score(sector_info.get("top_sectors", []))
     stock_score = _calc_stock_volume_score(stocks)
     capital_score = _calc_capital_score(capital)
     technical_score = _calc_technical_score(stocks)
 
-    score = (
-        sentiment_score * 0.25
-        + sector_score * 0.25
-        + stock_score * 0.20
-        + capital_score * 0.20
-        + technical_score * 0.10
-    )
-    score = round(clamp(score, 0, 100), 2)
+    score = round(_weighted_score((sentiment_score, sector_score, stock_score, capital_score, technical_score)), 2)
 
     if score >= 75 and risk["market_filter"] and len(stocks) > 0:
         signal = "SHORT_BUY"
@@ -114,7 +180,7 @@ def short_term_signal_engine(analysis_date: str | None = None, debug: bool = Fal
         "has_recommendation": len(stocks) > 0 and signal == "SHORT_BUY",
         "no_recommendation_message": no_msg,
         "factor_breakdown": {
-            "market_sentiment": round(sentiment_score, 2),
+            "market_sentiment": sentiment_score,
             "sector_strength": round(sector_score, 2),
             "stock_volume_strength": round(stock_score, 2),
             "capital_inflow": round(capital_score, 2),
@@ -126,6 +192,7 @@ def short_term_signal_engine(analysis_date: str | None = None, debug: bool = Fal
     debug_info = {
         "module": "short_term_signal_engine",
         "selected_symbol": target_symbol,
+        "limit_up_pool_date": ctx.chosen_date,
         "sources": {
             "market_sentiment": sentiment.get("data_source", "unknown"),
             "sector_rotation": sector_info.get("data_source", "unknown"),
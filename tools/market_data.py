@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
-import math
+import functools
 import re
-from typing import Any, Dict
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
+from ._kernels import candidate_kernel
+from ._numbers import vec_normalize
+from .cache import INTRADAY_TTL, QFQ_TTL, TTL, default_cache, ttl_for_trade_day
 from .debug_utils import is_fallback_enabled, resolve_debug, with_debug
-from .indicators import clamp, trend_up, volume_ratio
+from .indicators import clamp
 from .settings import get_screener_config
 
+if TYPE_CHECKING:
+    from .fusion_engine import Context
+
 try:
     import pandas as pd
 except Exception:  # pragma: no cover
     pd = None  # type: ignore
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 try:
     import akshare as ak  # type: ignore
 except Exception:  # pragma: no cover
@@ -24,33 +36,56 @@ except Exception:  # pragma: no cover
 
 TEST_STOCK_NAMES = {"DemoTech", "ChipStar", "RoboCore"}
 
+# Per-symbol daily bars are fetched concurrently; the scan is bound by HTTP latency, not CPU.
+_HIST_MAX_WORKERS = 16
+_CONS_MAX_WORKERS = 5
+# Board membership only changes on index rebalances; a trading session is plenty fresh.
+_CONS_TTL = 6 * 3600.0
+# Constituent endpoint per board family; names from one family are unknown to the other.
+_CONS_APIS = {"industry": "stock_board_industry_cons_em", "concept": "stock_board_concept_cons_em"}
+_BAR_COLUMNS = ["收盘", "开盘", "成交量"]
 
-@dataclass
-class StockCandidate:
-    code: str
-    name: str
-    change_pct: float
-    volume_ratio: float
-    strength_rank: int
-    sector: str
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "code": self.code,
-            "name": self.name,
-            "change_pct": round(self.change_pct, 2),
-            "volume_ratio": round(self.volume_ratio, 2),
-            "strength_rank": self.strength_rank,
-            "sector": self.sector,
-        }
+_BOARD_RE = re.compile(r"(\d+)")
 
+_ZT_FIELDS = {"height": (["连板数", "连板", "连板高度", "几天几板"], "1"), "state": (["状态", "涨停状态", "封板状态"], "")}
+_UNIVERSE_FIELDS = {
+    "code": (["代码", "股票代码"], ""),
+    "name": (["名称", "股票名称"], ""),
+    "sector": (["所属行业", "行业", "所属板块"], "UNKNOWN"),
+}
+
+
+def _to_tuples(frame: Any, cols: list[str]) -> tuple[Iterator[tuple[Any, ...]], list[str]]:
+    """Iterate only the present `cols` as plain tuples; cheaper than one dict per row."""
+    present = [col for col in dict.fromkeys(cols) if col in frame.columns]
+    return frame[present].itertuples(index=False, name=None), present
+
+
+def _spec_keys(spec: dict[str, tuple[list[str], Any]]) -> list[str]:
+    return [key for keys, _ in spec.values() for key in keys]
 
-def _to_records(frame: Any) -> list[dict[str, Any]]:
-    if frame is None or pd is None:
-        return []
-    if not isinstance(frame, pd.DataFrame) or frame.empty:
-        return []
-    return frame.to_dict(orient="records")
+
+def _cached_call(api: str, ttl: TTL = INTRADAY_TTL, **params: Any) -> Any:
+    return default_cache.get_or_fetch(api, params, lambda: getattr(ak, api)(**params), ttl=ttl)
+
+
+def load_spot_frame() -> Any:
+    """Fetch the nationwide spot table once so an engine run can share it via `Context`."""
+    if ak is None or pd is None:
+        return None
+    try:
+        spot_df = _cached_call("stock_zh_a_spot_em")
+    except Exception:
+        return None
+    return spot_df if isinstance(spot_df, pd.DataFrame) else None
+
+
+def _resolve_keys(sample: Any, keys: list[str]) -> str | None:
+    """Return the first of `keys` present in `sample` (a row dict or a DataFrame's columns)."""
+    for key in keys:
+        if key in sample:
+            return key
+    return None
 
 
 def _num(row: dict[str, Any], keys: list[str], default: float = 0.0) -> float:
@@ -70,38 +105,53 @@ def _str(row: dict[str, Any], keys: list[str], default: str = "") -> str:
     return default
 
 
-def _normalize_number(value: Any) -> float:
-    if value in ("", None):
-        return 0.0
-    if isinstance(value, (int, float)):
-        out = float(value)
-        return out if math.isfinite(out) else 0.0
-    text = str(value).strip().replace(",", "")
-    if text in ("-", "--"):
-        return 0.0
-
-    unit = 1.0
-    if text.endswith("亿"):
-        unit = 100_000_000.0
-        text = text[:-1]
-    elif text.endswith("万"):
-        unit = 10_000.0
-        text = text[:-1]
+def _field_getter(idx: int | None, default: Any) -> Callable[[Any], Any]:
+    if idx is None:
+        return lambda row: default
+    if isinstance(default, str):
 
-    try:
-        out = float(text) * unit
-        return out if math.isfinite(out) else 0.0
-    except Exception:
-        return 0.0
+        def read_str(row: Any) -> str:
+            value = row[idx]
+            return default if value is None else str(value).strip()
 
+        return read_str
+
+    def read_num(row: Any) -> float:
+        value = row[idx]
+        if value in (None, ""):
+            return default
+        try:
+            return float(value)
+        except Exception:
+            return default
+
+    return read_num
+
+
+def _make_reader(columns: list[str], spec: dict[str, tuple[list[str], Any]]) -> SimpleNamespace:
+    """
+    Resolve each field's position once per dataset for rows produced by `_to_tuples`.
+
+    spec maps field -> (candidate keys, default); a str default reads text like `_str`,
+    any other default reads a float like `_num`.
+    """
+    col_index = {col: idx for idx, col in enumerate(columns)}
+    getters = {}
+    for field, (keys, default) in spec.items():
+        key = _resolve_keys(col_index, keys)
+        getters[field] = _field_getter(col_index[key] if key else None, default)
+    return SimpleNamespace(**getters)
+
+
+def _frame_len(frame: Any) -> int:
+    return len(frame) if pd is not None and isinstance(frame, pd.DataFrame) else 0
 
-def _num_unit(row: dict[str, Any], keys: list[str], default: float = 0.0) -> float:
-    for key in keys:
-        if key in row:
-            parsed = _normalize_number(row[key])
-            if parsed != 0.0 or row[key] in (0, "0", "0.0"):
-                return parsed
-    return default
+
+def _column_values(frame: Any, key: str | None) -> Any:
+    """Numeric column as a float64 array; missing or unparseable cells become 0."""
+    if key is None:
+        return np.zeros(len(frame))
+    return pd.to_numeric(frame[key], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
 
 
 def _parse_board_height(raw: Any) -> int:
@@ -110,13 +160,20 @@ def _parse_board_height(raw: Any) -> int:
     if isinstance(raw, (int, float)):
         return int(raw)
     text = str(raw).strip()
-    match = re.search(r"(\d+)", text)
+    # Most rows are a bare count like "3"; isdecimal matches exactly what `\d` and int() accept.
+    if text.isdecimal():
+        return int(text)
+    match = _BOARD_RE.search(text)
     return int(match.group(1)) if match else 0
 
 
-def _parse_analysis_date(analysis_date: str | None) -> tuple[str, date]:
+def _resolve_today(ctx: Context | None = None) -> date:
+    return ctx.today if ctx is not None else datetime.now().date()
+
+
+def _parse_analysis_date(analysis_date: str | None, today: date | None = None) -> tuple[str, date]:
     if not analysis_date:
-        d = datetime.now().date()
+        d = today or datetime.now().date()
         return d.strftime("%Y%m%d"), d
     cleaned = analysis_date.strip()
     for fmt in ("%Y-%m-%d", "%Y%m%d"):
@@ -125,18 +182,19 @@ def _parse_analysis_date(analysis_date: str | None) -> tuple[str, date]:
             return d.strftime("%Y%m%d"), d
         except ValueError:
             pass
-    d = datetime.now().date()
+    d = today or datetime.now().date()
     return d.strftime("%Y%m%d"), d
 
 
-def _recent_trade_dates(anchor: date | None = None, days: int = 10) -> list[str]:
-    base = anchor or datetime.now().date()
+@functools.lru_cache(maxsize=1)
+def _trade_date_cache(today: date, days: int = 10) -> tuple[str, ...]:
+    """Weekdays among the `days` calendar days ending at `today`, newest first."""
     dates: list[str] = []
     for offset in range(days):
-        d = base - timedelta(days=offset)
+        d = today - timedelta(days=offset)
         if d.weekday() < 5:
             dates.append(d.strftime("%Y%m%d"))
-    return dates
+    return tuple(dates)
 
 
 def _fallback_market_sentiment(debug: bool = False, debug_info: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -154,11 +212,14 @@ def _fallback_market_sentiment(debug: bool = False, debug_info: dict[str, Any] |
     return with_debug(payload, debug, debug_info or {"reason": "fallback_empty_market_sentiment"})
 
 
-def get_market_sentiment(analysis_date: str | None = None, debug: bool = False) -> dict[str, Any]:
+def get_market_sentiment(
+    analysis_date: str | None = None, debug: bool = False, ctx: Context | None = None
+) -> dict[str, Any]:
     debug = resolve_debug(debug)
     screener_cfg = get_screener_config()
     fallback_ok = is_fallback_enabled(default=False)
-    target_ymd, target_date = _parse_analysis_date(analysis_date)
+    today = _resolve_today(ctx)
+    target_ymd, target_date = _parse_analysis_date(analysis_date, today)
 
     dbg: dict[str, Any] = {
         "module": "get_market_sentiment",
@@ -186,27 +247,29 @@ def get_market_sentiment(analysis_date: str | None = None, debug: bool = False)
         )
 
     chosen_date = ""
-    zt_records: list[dict[str, Any]] = []
-    dt_records: list[dict[str, Any]] = []
-    zb_records: list[dict[str, Any]] = []
+    zt_df: Any = None
+    limit_up = 0
+    limit_down = 0
+    zb_count = 0
 
-    date_candidates = [target_ymd] if analysis_date else _recent_trade_dates(anchor=target_date)
+    date_candidates = [target_ymd] if analysis_date else list(_trade_date_cache(target_date, 10))
     dbg["date_candidates"] = date_candidates
     dbg["api_calls"] = []
 
     for date_text in date_candidates:
         try:
-            zt_df = ak.stock_zt_pool_em(date=date_text)
-            records = _to_records(zt_df)
-            dbg["api_calls"].append({"api": "stock_zt_pool_em", "date": date_text, "ok": True, "rows": len(records)})
-            if records:
+            frame = _cached_call("stock_zt_pool_em", ttl=ttl_for_trade_day(date_text), date=date_text)
+            rows = _frame_len(frame)
+            dbg["api_calls"].append({"api": "stock_zt_pool_em", "date": date_text, "ok": True, "rows": rows})
+            if rows:
                 chosen_date = date_text
-                zt_records = records
+                zt_df = frame
+                limit_up = rows
                 break
         except Exception:
             dbg["api_calls"].append({"api": "stock_zt_pool_em", "date": date_text, "ok": False})
 
-    if not zt_records:
+    if not limit_up:
         dbg["fallback_reason"] = "empty_limit_up_pool"
         return _fallback_market_sentiment(debug=debug, debug_info=dbg) if fallback_ok else with_debug(
             {
@@ -225,40 +288,49 @@ def get_market_sentiment(analysis_date: str | None = None, debug: bool = False)
         )
 
     try:
-        dt_records = _to_records(ak.stock_zt_pool_dtgc_em(date=chosen_date))
-        dbg["api_calls"].append({"api": "stock_zt_pool_dtgc_em", "date": chosen_date, "ok": True, "rows": len(dt_records)})
+        limit_down = _frame_len(_cached_call("stock_zt_pool_dtgc_em", ttl=ttl_for_trade_day(chosen_date), date=chosen_date))
+        dbg["api_calls"].append({"api": "stock_zt_pool_dtgc_em", "date": chosen_date, "ok": True, "rows": limit_down})
     except Exception:
         dbg["api_calls"].append({"api": "stock_zt_pool_dtgc_em", "date": chosen_date, "ok": False})
 
     try:
         if hasattr(ak, "stock_zt_pool_zbgc_em"):
-            zb_records = _to_records(ak.stock_zt_pool_zbgc_em(date=chosen_date))
-            dbg["api_calls"].append({"api": "stock_zt_pool_zbgc_em", "date": chosen_date, "ok": True, "rows": len(zb_records)})
+            zb_count = _frame_len(_cached_call("stock_zt_pool_zbgc_em", ttl=ttl_for_trade_day(chosen_date), date=chosen_date))
+            dbg["api_calls"].append({"api": "stock_zt_pool_zbgc_em", "date": chosen_date, "ok": True, "rows": zb_count})
     except Exception:
         dbg["api_calls"].append({"api": "stock_zt_pool_zbgc_em", "date": chosen_date, "ok": False})
 
-    limit_up = len(zt_records)
-    limit_down = len(dt_records)
+    zt_rows, zt_cols = _to_tuples(zt_df, _spec_keys(_ZT_FIELDS))
+    zt = _make_reader(zt_cols, _ZT_FIELDS)
     max_height = 0
-    for row in zt_records:
-        max_height = max(max_height, _parse_board_height(_str(row, ["连板数", "连板", "连板高度", "几天几板"], "1")))
+    unsealed = 0
+    for row in zt_rows:
+        max_height = max(max_height, _parse_board_height(zt.height(row)))
+        state = zt.state(row)
+        if state and state not in ("封板", "涨停"):
+            unsealed += 1
 
-    break_count = len(zb_records)
-    if break_count == 0:
-        for row in zt_records:
-            state = _str(row, ["状态", "涨停状态", "封板状态"], "")
-            if state and state not in ("封板", "涨停"):
-                break_count += 1
+    # Prefer the dedicated broken-board pool; fall back to seal states in the limit-up pool.
+    break_count = zb_count or unsealed
 
     total_lu_events = limit_up + break_count
     break_rate = break_count / total_lu_events if total_lu_events else 0.0
 
+    if ctx is not None:
+        ctx.chosen_date = chosen_date
+
     turnover = 0.0
     try:
-        spot_records = _to_records(ak.stock_zh_a_spot_em())
-        dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": True, "rows": len(spot_records)})
-        for row in spot_records:
-            turnover += _num_unit(row, ["成交额", "成交额(元)", "amount"], 0.0)
+        if ctx is not None and ctx.spot_df is not None:
+            spot_df = ctx.spot_df
+            dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": True, "rows": _frame_len(spot_df), "shared": True})
+        else:
+            spot_df = _cached_call("stock_zh_a_spot_em")
+            dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": True, "rows": _frame_len(spot_df)})
+        # Spot amounts are plain floats; vec_normalize only parses 万/亿 text when the column is object dtype.
+        amount_key = _resolve_keys(spot_df, ["成交额", "成交额(元)", "amount"]) if _frame_len(spot_df) else None
+        if amount_key:
+            turnover = float(vec_normalize(spot_df[amount_key]).sum())
     except Exception:
         dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": False})
 
@@ -294,11 +366,14 @@ def _fallback_sector_rotation(debug: bool = False, debug_info: dict[str, Any] |
     return with_debug(payload, debug, debug_info or {"reason": "fallback_empty_sector_rotation"})
 
 
-def get_sector_rotation(top_n: int = 5, analysis_date: str | None = None, debug: bool = False) -> dict[str, Any]:
+def get_sector_rotation(
+    top_n: int = 5, analysis_date: str | None = None, debug: bool = False, ctx: Context | None = None
+) -> dict[str, Any]:
     debug = resolve_debug(debug)
     screener_cfg = get_screener_config()
     fallback_ok = is_fallback_enabled(default=False)
-    target_ymd, target_date = _parse_analysis_date(analysis_date)
+    today = _resolve_today(ctx)
+    target_ymd, target_date = _parse_analysis_date(analysis_date, today)
 
     dbg: dict[str, Any] = {"module": "get_sector_rotation", "analysis_date": target_ymd, "api_calls": [], "fallback_enabled": fallback_ok}
     if ak is None or pd is None:
@@ -315,7 +390,7 @@ def get_sector_rotation(top_n: int = 5, analysis_date: str | None = None, debug:
         )
 
     # AkShare board endpoints are snapshot-style, no stable historical-by-date endpoint.
-    if analysis_date and target_date != datetime.now().date():
+    if analysis_date and target_date != today:
         dbg["fallback_reason"] = "historical_sector_snapshot_unavailable"
         return with_debug(
             {
@@ -328,21 +403,24 @@ def get_sector_rotation(top_n: int = 5, analysis_date: str | None = None, debug:
             dbg,
         )
 
-    sector_rows: list[dict[str, Any]] = []
+    sector_df: Any = None
+    board_type = "industry"
     try:
-        sector_rows = _to_records(ak.stock_board_industry_name_em())
-        dbg["api_calls"].append({"api": "stock_board_industry_name_em", "ok": True, "rows": len(sector_rows)})
+        sector_df = _cached_call("stock_board_industry_name_em")
+        dbg["api_calls"].append({"api": "stock_board_industry_name_em", "ok": True, "rows": _frame_len(sector_df)})
     except Exception:
         dbg["api_calls"].append({"api": "stock_board_industry_name_em", "ok": False})
 
-    if not sector_rows and hasattr(ak, "stock_board_concept_name_em"):
+    if not _frame_len(sector_df) and hasattr(ak, "stock_board_concept_name_em"):
         try:
-            sector_rows = _to_records(ak.stock_board_concept_name_em())
-            dbg["api_calls"].append({"api": "stock_board_concept_name_em", "ok": True, "rows": len(sector_rows)})
+            sector_df = _cached_call("stock_board_concept_name_em")
+            board_type = "concept"
+            dbg["api_calls"].append({"api": "stock_board_concept_name_em", "ok": True, "rows": _frame_len(sector_df)})
         except Exception:
             dbg["api_calls"].append({"api": "stock_board_concept_name_em", "ok": False})
 
-    if not sector_rows:
+    rows_total = _frame_len(sector_df)
+    if not rows_total:
         dbg["fallback_reason"] = "no_sector_rows"
         return _fallback_sector_rotation(debug=debug, debug_info=dbg) if fallback_ok else with_debug(
             {
@@ -355,42 +433,44 @@ def get_sector_rotation(top_n: int = 5, analysis_date: str | None = None, debug:
             dbg,
         )
 
-    sectors: list[dict[str, Any]] = []
-    max_turnover = max(_num_unit(row, ["成交额", "总成交额", "总市值"], 0.0) for row in sector_rows) or 1.0
-
-    for row in sector_rows:
-        name = _str(row, ["板块名称", "名称"], "UNKNOWN")
-        change_pct = _num(row, ["涨跌幅", "涨跌幅%"], 0.0)
-        turnover = _num_unit(row, ["成交额", "总成交额", "总市值"], 0.0)
-        up_count = int(_num(row, ["上涨家数"], 0.0))
-        limit_up_count = int(_num(row, ["涨停家数"], 0.0))
-        if limit_up_count == 0 and up_count > 0:
-            limit_up_count = int(up_count * 0.08)
-
-        strength = (
-            clamp(change_pct / 7 * 45, 0, 45)
-            + clamp(turnover / max_turnover * 25, 0, 25)
-            + clamp(limit_up_count / 12 * 30, 0, 30)
-        )
+    # Score every board on contiguous float64 columns; build dicts only for the returned rows.
+    change_pct = _column_values(sector_df, _resolve_keys(sector_df, ["涨跌幅", "涨跌幅%"]))
+    turnover_key = _resolve_keys(sector_df, ["成交额", "总成交额", "总市值"])
+    turnover = vec_normalize(sector_df[turnover_key]).to_numpy(dtype=np.float64) if turnover_key else np.zeros(rows_total)
+    up_count = np.trunc(_column_values(sector_df, _resolve_keys(sector_df, ["上涨家数"])))
+    limit_up = np.trunc(_column_values(sector_df, _resolve_keys(sector_df, ["涨停家数"])))
+    limit_up = np.where((limit_up == 0) & (up_count > 0), np.trunc(up_count * 0.08), limit_up)
+    max_turnover = float(turnover.max()) or 1.0
+
+    strength = (
+        np.clip(change_pct / 7 * 45, 0, 45)
+        + np.clip(turnover / max_turnover * 25, 0, 25)
+        + np.clip(limit_up / 12 * 30, 0, 30)
+    )
+    # The board table is ~100 rows; a stable full sort keeps table order among equal strengths.
+    order = np.argsort(-strength, kind="stable")[: max(top_n, 0)]
 
+    sectors: list[dict[str, Any]] = []
+    for idx in order:
+        row = sector_df.iloc[idx]
         sectors.append(
             {
-                "name": name,
-                "change_pct": round(change_pct, 2),
-                "turnover": int(turnover),
-                "limit_up_count": limit_up_count,
+                "name": _str(row, ["板块名称", "名称"], "UNKNOWN"),
+                "change_pct": round(float(change_pct[idx]), 2),
+                "turnover": int(turnover[idx]),
+                "limit_up_count": int(limit_up[idx]),
                 "board_code": _str(row, ["板块代码", "代码"], ""),
-                "strength": round(strength, 2),
+                "strength": round(float(strength[idx]), 2),
             }
         )
 
-    sectors.sort(key=lambda x: x["strength"], reverse=True)
     payload = {
         "date": target_date.strftime("%Y-%m-%d"),
-        "top_sectors": sectors[:top_n],
+        "top_sectors": sectors,
+        "board_type": board_type,
         "data_source": "akshare-live",
     }
-    dbg["derived"] = {"input_rows": len(sector_rows), "returned_rows": min(top_n, len(sectors))}
+    dbg["derived"] = {"input_rows": rows_total, "returned_rows": len(sectors)}
     return with_debug(payload, debug, dbg)
 
 
@@ -401,97 +481,142 @@ def _fallback_scan_strong_stocks(
 
 
 def _scan_from_hist_candidates(
-    rows: list[dict[str, Any]],
+    frame: Any,
     analysis_ymd: str,
     sectors: list[str] | None,
     top_n: int,
     debug_info: dict[str, Any],
     screener_cfg: dict[str, Any],
     historical_mode: bool = False,
+    sector_map: dict[str, str] | None = None,
 ) -> list[dict[str, Any]]:
-    candidates: list[StockCandidate] = []
+    """`sector_map` (code -> board) labels rows already filtered by constituent codes."""
+    start_date = (datetime.strptime(analysis_ymd, "%Y%m%d").date() - timedelta(days=45)).strftime("%Y%m%d")
+    if not _frame_len(frame):
+        return []
+    rows, cols = _to_tuples(frame, _spec_keys(_UNIVERSE_FIELDS))
+    reader = _make_reader(cols, _UNIVERSE_FIELDS)
+    pending: list[tuple[str, str, str]] = []
     for row in rows:
-        code = _str(row, ["代码", "股票代码"], "")
+        code = reader.code(row)
         if not code:
             continue
-        name = _str(row, ["名称", "股票名称"], "")
+        name = reader.name(row)
         if name in TEST_STOCK_NAMES:
             continue
-        sector = _str(row, ["所属行业", "行业", "所属板块"], "UNKNOWN")
-        if sectors and sector not in sectors:
-            continue
+        if sector_map:
+            sector = sector_map.get(code, "UNKNOWN")
+        else:
+            sector = reader.sector(row)
+            if sectors and sector not in sectors:
+                continue
+        pending.append((code, name, sector))
+    if not pending:
+        return []
 
-        try:
-            start_date = (datetime.strptime(analysis_ymd, "%Y%m%d").date() - timedelta(days=45)).strftime("%Y%m%d")
-            hist = ak.stock_zh_a_hist(symbol=code, period="daily", start_date=start_date, end_date=analysis_ymd, adjust="qfq")
-            records = _to_records(hist)
-            debug_info.setdefault("api_calls", []).append({"api": "stock_zh_a_hist", "symbol": code, "ok": True, "rows": len(records)})
-        except Exception:
-            debug_info.setdefault("api_calls", []).append({"api": "stock_zh_a_hist", "symbol": code, "ok": False})
-            continue
+    hist_cfg = screener_cfg.get("historical_mode", {}) if historical_mode else {}
+    min_history = int(screener_cfg.get("min_history_days", 6))
+    min_change = float(hist_cfg.get("min_change_pct", screener_cfg.get("min_change_pct", 5.0)))
+    trend_lb = int(hist_cfg.get("trend_lookback", screener_cfg.get("trend_lookback", 3)))
+    base_days = int(screener_cfg.get("volume_baseline_days", 5))
+    min_vr = float(hist_cfg.get("min_volume_ratio", screener_cfg.get("min_volume_ratio", 1.5)))
+    drop_th = float(hist_cfg.get("high_volume_bearish_drop_pct", screener_cfg.get("high_volume_bearish_drop_pct", -2.0)))
+    vol_th = float(hist_cfg.get("high_volume_bearish_vol_ratio", screener_cfg.get("high_volume_bearish_vol_ratio", 2.2)))
+
+    evaluate_candidate = candidate_kernel()
+
+    # Accepted symbols as parallel columns (index into `pending`, change, volume ratio).
+    acc_pos: list[int] = []
+    acc_chg: list[float] = []
+    acc_vr: list[float] = []
+    with ThreadPoolExecutor(max_workers=min(_HIST_MAX_WORKERS, len(pending))) as executor:
+        futures = {
+            executor.submit(
+                _cached_call,
+                "stock_zh_a_hist",
+                ttl=ttl_for_trade_day(analysis_ymd, max_age=QFQ_TTL),
+                symbol=code,
+                period="daily",
+                start_date=start_date,
+                end_date=analysis_ymd,
+                adjust="qfq",
+            ): pos
+            for pos, (code, _, _) in enumerate(pending)
+        }
+        for future in as_completed(futures):
+            pos = futures[future]
+            code = pending[pos][0]
+            try:
+                hist = future.result()
+                hist_rows = len(hist) if isinstance(hist, pd.DataFrame) else 0
+                debug_info.setdefault("api_calls", []).append({"api": "stock_zh_a_hist", "symbol": code, "ok": True, "rows": hist_rows})
+            except Exception:
+                debug_info.setdefault("api_calls", []).append({"api": "stock_zh_a_hist", "symbol": code, "ok": False})
+                continue
 
-        if len(records) < int(screener_cfg.get("min_history_days", 6)):
-            continue
+            if hist_rows == 0 or hist_rows < min_history:
+                continue
+            change_pct = _num(hist.iloc[-1], ["涨跌幅"], 0.0)
+            if change_pct <= min_change:
+                continue
 
-        closes = [_num(x, ["收盘"], 0.0) for x in records]
-        opens = [_num(x, ["开盘"], 0.0) for x in records]
-        volumes = [_num(x, ["成交量"], 0.0) for x in records]
-        change_pct = _num(records[-1], ["涨跌幅"], 0.0)
+            # One contiguous float64 block per symbol; rows are close/open/volume.
+            bars = hist.reindex(columns=_BAR_COLUMNS).apply(pd.to_numeric, errors="coerce")
+            closes, opens, volumes = np.ascontiguousarray(bars.to_numpy(dtype=np.float64, na_value=0.0).T)
+            accept, vol_ratio, _ = evaluate_candidate(closes, opens, volumes, trend_lb, base_days, min_vr, drop_th, vol_th)
+            if not accept:
+                continue
 
-        min_change = float(screener_cfg.get("min_change_pct", 5.0))
-        if historical_mode:
-            min_change = float(screener_cfg.get("historical_mode", {}).get("min_change_pct", min_change))
-        if change_pct <= min_change:
-            continue
-        trend_lb = int(screener_cfg.get("trend_lookback", 3))
-        if historical_mode:
-            trend_lb = int(screener_cfg.get("historical_mode", {}).get("trend_lookback", trend_lb))
-        if not trend_up(closes, lookback=trend_lb):
-            continue
+            acc_pos.append(pos)
+            acc_chg.append(change_pct)
+            acc_vr.append(float(vol_ratio))
 
-        base_days = int(screener_cfg.get("volume_baseline_days", 5))
-        baseline = sum(volumes[-(base_days + 1):-1]) / max(len(volumes[-(base_days + 1):-1]), 1)
-        vol_ratio = volume_ratio(volumes[-1], baseline)
-        min_vr = float(screener_cfg.get("min_volume_ratio", 1.5))
-        if historical_mode:
-            min_vr = float(screener_cfg.get("historical_mode", {}).get("min_volume_ratio", min_vr))
-        if vol_ratio <= min_vr:
-            continue
+    if not acc_pos:
+        return []
+    # Change desc, then volume ratio desc; results arrive in completion order, so universe
+    # position breaks the remaining ties deterministically.
+    positions = np.asarray(acc_pos)
+    chgs = np.asarray(acc_chg, dtype=np.float64)
+    vrs = np.asarray(acc_vr, dtype=np.float64)
+    order = np.lexsort((positions, -vrs, -chgs))[:top_n]
+    ranked: list[dict[str, Any]] = []
+    for rank, idx in enumerate(order.tolist(), start=1):
+        code, name, sector = pending[acc_pos[idx]]
+        ranked.append(
+            {
+                "code": code,
+                "name": name,
+                "change_pct": acc_chg[idx],
+                "volume_ratio": acc_vr[idx],
+                "strength_rank": rank,
+                "sector": sector,
+            }
+        )
+    return ranked
 
-        prev_close = closes[-2] if len(closes) > 1 else 0.0
-        last_day_change = ((closes[-1] - prev_close) / prev_close * 100) if prev_close else 0.0
-        drop_th = float(screener_cfg.get("high_volume_bearish_drop_pct", -2.0))
-        vol_th = float(screener_cfg.get("high_volume_bearish_vol_ratio", 2.2))
-        if historical_mode:
-            drop_th = float(screener_cfg.get("historical_mode", {}).get("high_volume_bearish_drop_pct", drop_th))
-            vol_th = float(screener_cfg.get("historical_mode", {}).get("high_volume_bearish_vol_ratio", vol_th))
-        high_volume_bearish = opens[-1] > closes[-1] and last_day_change < drop_th and vol_ratio > vol_th
-        if high_volume_bearish:
-            continue
 
-        candidates.append(
-            StockCandidate(
-                code=code,
-                name=name,
-                change_pct=change_pct,
-                volume_ratio=vol_ratio,
-                strength_rank=0,
-                sector=sector,
-            )
-        )
+def _resolve_sector_codes(sectors: list[str], board_type: str, debug_info: dict[str, Any]) -> dict[str, str]:
+    """Map constituent code -> board for each requested board, fetched concurrently."""
+    api = _CONS_APIS.get(board_type, _CONS_APIS["industry"])
 
-    candidates.sort(key=lambda x: (x.change_pct, x.volume_ratio), reverse=True)
-    ranked: list[dict[str, Any]] = []
-    rank_counter = 1
-    for item in candidates:
-        if item.name in TEST_STOCK_NAMES:
-            continue
-        item.strength_rank = rank_counter
-        ranked.append(item.to_dict())
-        rank_counter += 1
-        if len(ranked) >= top_n:
-            break
-    return ranked
+    def _fetch_cons(name: str) -> tuple[set[str], dict[str, Any]]:
+        try:
+            cons_df = _cached_call(api, ttl=_CONS_TTL, symbol=name)
+            code_key = _resolve_keys(cons_df, ["代码", "股票代码"]) if _frame_len(cons_df) else None
+            codes = set(cons_df[code_key].dropna().astype(str).str.strip()) if code_key else set()
+            codes.discard("")
+            return codes, {"api": api, "symbol": name, "ok": True, "rows": len(codes)}
+        except Exception:
+            return set(), {"api": api, "symbol": name, "ok": False}
+
+    code_sector: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=min(_CONS_MAX_WORKERS, len(sectors))) as executor:
+        # map() keeps input order, so a code listed under several boards takes the higher-ranked one.
+        for name, (codes, call) in zip(sectors, executor.map(_fetch_cons, sectors)):
+            debug_info["api_calls"].append(call)
+            for code in codes:
+                code_sector.setdefault(code, name)
+    return code_sector
 
 
 def scan_strong_stocks(
@@ -499,11 +624,15 @@ def scan_strong_stocks(
     top_n: int = 10,
     analysis_date: str | None = None,
     debug: bool = False,
+    ctx: Context | None = None,
+    board_type: str = "industry",
 ) -> list[dict[str, Any]]:
+    """`board_type` names the board family of `sectors` ("industry" or "concept")."""
     debug = resolve_debug(debug)
     screener_cfg = get_screener_config()
     fallback_ok = is_fallback_enabled(default=False)
-    analysis_ymd, analysis_day = _parse_analysis_date(analysis_date)
+    today = _resolve_today(ctx)
+    analysis_ymd, analysis_day = _parse_analysis_date(analysis_date, today)
     dbg: dict[str, Any] = {
         "module": "scan_strong_stocks",
         "analysis_date": analysis_ymd,
@@ -517,56 +646,71 @@ def scan_strong_stocks(
         return _fallback_scan_strong_stocks(sectors, top_n, debug=debug, debug_info=dbg) if fallback_ok else []
 
     # Historical-date mode: use that date's limit-up pool as universe, then verify with historical bars.
-    if analysis_date and analysis_day != datetime.now().date():
+    if analysis_date and analysis_day != today:
         try:
-            zt_rows = _to_records(ak.stock_zt_pool_em(date=analysis_ymd))
-            dbg["api_calls"].append({"api": "stock_zt_pool_em", "date": analysis_ymd, "ok": True, "rows": len(zt_rows)})
+            zt_df = _cached_call("stock_zt_pool_em", ttl=ttl_for_trade_day(analysis_ymd), date=analysis_ymd)
+            dbg["api_calls"].append({"api": "stock_zt_pool_em", "date": analysis_ymd, "ok": True, "rows": _frame_len(zt_df)})
         except Exception:
-            zt_rows = []
+            zt_df = None
             dbg["api_calls"].append({"api": "stock_zt_pool_em", "date": analysis_ymd, "ok": False})
 
-        if not zt_rows:
+        if not _frame_len(zt_df):
             return []
 
-        ranked = _scan_from_hist_candidates(zt_rows, analysis_ymd, sectors=sectors, top_n=top_n, debug_info=dbg, screener_cfg=screener_cfg, historical_mode=True)
+        ranked = _scan_from_hist_candidates(zt_df, analysis_ymd, sectors=sectors, top_n=top_n, debug_info=dbg, screener_cfg=screener_cfg, historical_mode=True)
         if debug:
-            dbg["derived"] = {"historical_mode": True, "universe": len(zt_rows), "candidates": len(ranked)}
+            dbg["derived"] = {"historical_mode": True, "universe": len(zt_df), "candidates": len(ranked)}
             return [dict(item, debug_info=dbg) for item in ranked]
         return ranked
 
     # Realtime mode
-    try:
-        spot_df = ak.stock_zh_a_spot_em()
-        dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": True})
-    except Exception:
-        dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": False})
-        dbg["fallback_reason"] = "spot_api_failed"
-        return _fallback_scan_strong_stocks(sectors, top_n, debug=debug, debug_info=dbg) if fallback_ok else []
+    if ctx is not None and ctx.spot_df is not None:
+        spot_df = ctx.spot_df
+        dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": True, "shared": True})
+    else:
+        try:
+            spot_df = _cached_call("stock_zh_a_spot_em")
+            dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": True})
+        except Exception:
+            dbg["api_calls"].append({"api": "stock_zh_a_spot_em", "ok": False})
+            dbg["fallback_reason"] = "spot_api_failed"
+            return _fallback_scan_strong_stocks(sectors, top_n, debug=debug, debug_info=dbg) if fallback_ok else []
 
-    rows = _to_records(spot_df)
-    if not rows:
+    if not isinstance(spot_df, pd.DataFrame) or spot_df.empty:
         dbg["fallback_reason"] = "spot_rows_empty"
         return _fallback_scan_strong_stocks(sectors, top_n, debug=debug, debug_info=dbg) if fallback_ok else []
 
-    pre_filtered = []
-    for row in rows:
-        code = _str(row, ["代码", "股票代码"], "")
-        name = _str(row, ["名称", "股票名称"], "")
-        change_pct = _num(row, ["涨跌幅"], 0.0)
-        if name in TEST_STOCK_NAMES:
-            continue
-        if change_pct > float(screener_cfg.get("prefilter_change_pct", 4.5)) and code:
-            pre_filtered.append(row)
-
-    pre_filtered.sort(key=lambda x: _num(x, ["涨跌幅"], 0.0), reverse=True)
-    universe = pre_filtered[:120]
-    ranked = _scan_from_hist_candidates(universe, analysis_ymd, sectors=sectors, top_n=top_n, debug_info=dbg, screener_cfg=screener_cfg, historical_mode=False)
+    # Filter the ~5000-row spot table column-wise; only the 120 survivors are iterated per row.
+    code_key = _resolve_keys(spot_df, ["代码", "股票代码"])
+    name_key = _resolve_keys(spot_df, ["名称", "股票名称"])
+    codes = spot_df[code_key].fillna("").astype(str).str.strip() if code_key else pd.Series("", index=spot_df.index)
+    names = spot_df[name_key].fillna("").astype(str).str.strip() if name_key else pd.Series("", index=spot_df.index)
+    change_pct = pd.to_numeric(spot_df["涨跌幅"], errors="coerce").fillna(0.0) if "涨跌幅" in spot_df else pd.Series(0.0, index=spot_df.index)
+    mask = (change_pct > float(screener_cfg.get("prefilter_change_pct", 4.5))) & (codes != "") & ~names.isin(TEST_STOCK_NAMES)
+    # The spot table carries no industry column, so sector filtering goes through board constituents.
+    # No survivors means nothing to label; skip the constituent round-trips.
+    sector_map = _resolve_sector_codes(sectors, board_type, dbg) if sectors and mask.any() else {}
+    if sector_map:
+        mask &= codes.isin(sector_map.keys())
+    pre_filtered = spot_df[mask]
+    top_idx = change_pct[mask].nlargest(120).index
+    universe = pre_filtered.loc[top_idx]
+    ranked = _scan_from_hist_candidates(
+        universe,
+        analysis_ymd,
+        sectors=sectors,
+        top_n=top_n,
+        debug_info=dbg,
+        screener_cfg=screener_cfg,
+        historical_mode=False,
+        sector_map=sector_map,
+    )
 
     if not debug:
         return ranked
     dbg["derived"] = {
         "historical_mode": False,
-        "spot_rows": len(rows),
+        "spot_rows": len(spot_df),
         "pre_filtered": len(pre_filtered),
         "universe": len(universe),
         "candidates": len(ranked),
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-import math
-from typing import Any, Dict
-
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+import functools
+import threading
+import time
+from typing import Any, Dict, Sequence
+
+from ._numbers import normalize_number, vec_normalize
+from .cache import cached, in_trading_session, is_cache_enabled, last_session_close
 from .debug_utils import is_fallback_enabled, resolve_debug, with_debug
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 try:
     import pandas as pd
 except Exception:  # pragma: no cover
@@ -19,50 +29,132 @@ except Exception:  # pragma: no cover
     ak = None  # type: ignore
 
 
-def _to_records(frame: Any) -> list[dict[str, Any]]:
-    if frame is None or pd is None:
-        return []
-    if not isinstance(frame, pd.DataFrame) or frame.empty:
-        return []
-    return frame.to_dict(orient="records")
+_LITERAL_ZEROS = (0, "0", "0.0")
 
+_RANK_TTL = 15 * 60.0
+# Candidate column names per endpoint, in priority order.
+_NORTH_KEYS = ("value", "净流入", "当日净流入", "净买额")
+_HIST_KEYS = ("当日成交净买额", "当日净流入", "净买额", "净流入")
+_MAIN_KEYS = ("主力净流入-净额", "主力净额", "主力净流入", "主力净流入净额")
+_RANK_FLOW_KEYS = ("今日主力净流入-净额", "主力净流入-净额", "主力净额")
+
+# indicator -> {code: {flow column: value}}; one rank snapshot serves every symbol lookup.
+_RANK_INDEX: dict[str, dict[str, dict[str, Any]]] = {}
+_RANK_LOADED_AT: dict[str, float] = {}
+_RANK_LOCK = threading.Lock()
+
+
+def _northbound_fresh(written_at: float) -> bool:
+    # Northbound totals move during the session and are final only once written after the close.
+    now = datetime.now()
+    age = now.timestamp() - written_at
+    if in_trading_session(now):
+        return age <= 30 * 60.0
+    return written_at >= last_session_close(now).timestamp() and age <= 24 * 3600.0
 
-def _normalize_number(value: Any) -> float:
-    if value in ("", None):
-        return 0.0
-    if isinstance(value, (int, float)):
-        out = float(value)
-        return out if math.isfinite(out) else 0.0
-    text = str(value).strip().replace(",", "")
-    if text in ("-", "--"):
-        return 0.0
-    unit = 1.0
-    if text.endswith("亿"):
-        unit = 100_000_000.0
-        text = text[:-1]
-    elif text.endswith("万"):
-        unit = 10_000.0
-        text = text[:-1]
-    try:
-        out = float(text) * unit
-        return out if math.isfinite(out) else 0.0
-    except Exception:
-        return 0.0
 
+@cached("stock_hsgt_north_net_flow_in_em", ttl=_northbound_fresh)
+def _fetch_north_net_flow(**params: Any) -> Any:
+    return ak.stock_hsgt_north_net_flow_in_em(**params)
+
+
+@cached("stock_hsgt_hist_em", ttl=_northbound_fresh)
+def _fetch_hsgt_hist(**params: Any) -> Any:
+    return ak.stock_hsgt_hist_em(**params)
+
+
+@cached("stock_individual_fund_flow", ttl=3600.0)
+def _fetch_individual_fund_flow(**params: Any) -> Any:
+    return ak.stock_individual_fund_flow(**params)
+
+
+@cached("stock_individual_fund_flow_rank", ttl=15 * 60.0)
+def _fetch_fund_flow_rank(**params: Any) -> Any:
+    return ak.stock_individual_fund_flow_rank(**params)
+
+
+def _load_rank_index(indicator: str = "今日", debug_info: dict[str, Any] | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Return the in-memory rank snapshot for `indicator`, refetching it every `_RANK_TTL` seconds.
+
+    With caching disabled the snapshot is never reused, like the disk cache and the result memo.
+    """
+    with _RANK_LOCK:
+        if is_cache_enabled() and time.time() - _RANK_LOADED_AT.get(indicator, 0.0) < _RANK_TTL:
+            if debug_info is not None:
+                debug_info.setdefault("api_calls", []).append(
+                    {"api": "stock_individual_fund_flow_rank", "indicator": indicator, "ok": True, "shared": True}
+                )
+            return _RANK_INDEX.get(indicator, {})
+        try:
+            rank_df = _fetch_fund_flow_rank(indicator=indicator)
+        except Exception:
+            if debug_info is not None:
+                debug_info.setdefault("api_calls", []).append(
+                    {"api": "stock_individual_fund_flow_rank", "indicator": indicator, "ok": False}
+                )
+            return {}
+
+        index: dict[str, dict[str, Any]] = {}
+        columns = list(rank_df.columns) if isinstance(rank_df, pd.DataFrame) else []
+        code_key = next((key for key in ("股票代码", "代码") if key in columns), None)
+        flow_keys = [key for key in _RANK_FLOW_KEYS if key in columns]
+        if code_key:
+            for code, *values in rank_df[[code_key, *flow_keys]].itertuples(index=False, name=None):
+                index[str(code).strip()] = dict(zip(flow_keys, values))
+        if debug_info is not None:
+            debug_info.setdefault("api_calls", []).append(
+                {"api": "stock_individual_fund_flow_rank", "indicator": indicator, "ok": True, "rows": len(index)}
+            )
+        _RANK_INDEX[indicator] = index
+        _RANK_LOADED_AT[indicator] = time.time()
+        return index
+
+
+def _frame_len(frame: Any) -> int:
+    return len(frame) if pd is not None and isinstance(frame, pd.DataFrame) else 0
+
+
+def _extract_series(frame: Any, candidate_cols: Sequence[str]) -> Any:
+    """
+    Parse the first usable candidate column into a float64 array, one value per row.
+
+    Per row this follows `_num_unit`: blank or unparseable cells fall through to the next
+    column, while a nonzero amount or a literal 0 settles the row.
+    """
+    if not _frame_len(frame):
+        return np.zeros(0)
+    out = np.zeros(len(frame))
+    settled = np.zeros(len(frame), dtype=bool)
+    for col in candidate_cols:
+        if col not in frame.columns:
+            continue
+        raw = frame[col]
+        parsed = vec_normalize(raw).to_numpy(dtype=np.float64)
+        todo = ~settled
+        out[todo] = parsed[todo]
+        settled |= (parsed != 0.0) | raw.isin(_LITERAL_ZEROS).to_numpy(dtype=bool)
+        if settled.all():
+            break
+    return out
 
-def _num_unit(row: dict[str, Any], keys: list[str], default: float = 0.0) -> float:
+
+def _num_unit(row: dict[str, Any], keys: Sequence[str], default: float = 0.0) -> float:
     for key in keys:
-        if key in row:
-            parsed = _normalize_number(row[key])
-            if parsed != 0.0 or row[key] in (0, "0", "0.0"):
-                return parsed
+        # One probe per key; missing and blank cells both fall through to the next key.
+        value = row.get(key)
+        if value in ("", None):
+            continue
+        parsed = normalize_number(value)
+        if parsed != 0.0 or value in _LITERAL_ZEROS:
+            return parsed
     return default
 
 
-def _parse_analysis_date(analysis_date: str | None) -> tuple[str, datetime]:
+def _parse_analysis_date(analysis_date: str | None, today: date) -> tuple[str, datetime]:
+    fallback = datetime(today.year, today.month, today.day)
     if not analysis_date:
-        now = datetime.now()
-        return now.strftime("%Y%m%d"), now
+        return fallback.strftime("%Y%m%d"), fallback
     cleaned = analysis_date.strip()
     for fmt in ("%Y-%m-%d", "%Y%m%d"):
         try:
@@ -70,8 +162,13 @@ def _parse_analysis_date(analysis_date: str | None) -> tuple[str, datetime]:
             return d.strftime("%Y%m%d"), d
         except ValueError:
             pass
-    now = datetime.now()
-    return now.strftime("%Y%m%d"), now
+    return fallback.strftime("%Y%m%d"), fallback
+
+
+@functools.lru_cache(maxsize=16)
+def _date_window(end_day: date, days: int = 15) -> tuple[str, str]:
+    """(start, end) YYYYMMDD strings for a fund-flow query ending on `end_day`."""
+    return (end_day - timedelta(days=days)).strftime("%Y%m%d"), end_day.strftime("%Y%m%d")
 
 
 def _fallback_capital_flow(
@@ -90,99 +187,93 @@ def _fallback_capital_flow(
     return with_debug(payload, debug, debug_info or {"reason": "fallback_empty_capital_flow"})
 
 
-def _count_consecutive_inflow(values: list[float]) -> int:
-    count = 0
-    for item in reversed(values):
-        if item > 0:
-            count += 1
-        else:
-            break
-    return count
+def _count_consecutive_inflow(values: Any) -> int:
+    """Length of the trailing run of positive values."""
+    nonpos = np.asarray(values, dtype=np.float64)[::-1] <= 0
+    return int(np.argmax(nonpos)) if nonpos.any() else int(nonpos.size)
+
+
+def _load_hsgt_hist_series(symbol: str) -> tuple[Any, dict[str, Any]]:
+    """Non-zero daily net buys for one stock_hsgt_hist_em symbol, plus its api_calls entry."""
+    try:
+        hist_df = _fetch_hsgt_hist(symbol=symbol)
+        vals = _extract_series(hist_df, _HIST_KEYS)
+        return vals[vals != 0.0], {"api": "stock_hsgt_hist_em", "symbol": symbol, "ok": True, "rows": _frame_len(hist_df)}
+    except Exception:
+        return np.zeros(0), {"api": "stock_hsgt_hist_em", "symbol": symbol, "ok": False}
 
 
-def _load_northbound_series(debug_info: dict[str, Any] | None = None) -> list[float]:
+def _load_northbound_series(debug_info: dict[str, Any] | None = None) -> Any:
+    """Trailing non-zero daily northbound net flows (oldest first) as a float64 array."""
     if ak is None or pd is None:
         return []
 
     try:
-        flow_df = ak.stock_hsgt_north_net_flow_in_em(symbol="北上")
-        flow_records = _to_records(flow_df)
+        flow_df = _fetch_north_net_flow(symbol="北上")
         if debug_info is not None:
             debug_info.setdefault("api_calls", []).append(
-                {"api": "stock_hsgt_north_net_flow_in_em", "ok": True, "rows": len(flow_records)}
+                {"api": "stock_hsgt_north_net_flow_in_em", "ok": True, "rows": _frame_len(flow_df)}
             )
-        vals = [_num_unit(x, ["value", "净流入", "当日净流入", "净买额"], 0.0) for x in flow_records]
-        vals = [x for x in vals if x != 0.0]
-        if vals:
+        vals = _extract_series(flow_df, _NORTH_KEYS)
+        vals = vals[vals != 0.0]
+        if len(vals):
             return vals[-60:]
     except Exception:
         if debug_info is not None:
             debug_info.setdefault("api_calls", []).append({"api": "stock_hsgt_north_net_flow_in_em", "ok": False})
 
     if hasattr(ak, "stock_hsgt_hist_em"):
+        # Priority order: the combined series, then the Shanghai and Shenzhen legs on their own.
         for symbol in ("北向资金", "沪股通", "深股通"):
-            try:
-                hist_df = ak.stock_hsgt_hist_em(symbol=symbol)
-                hist_records = _to_records(hist_df)
-                if debug_info is not None:
-                    debug_info.setdefault("api_calls", []).append(
-                        {"api": "stock_hsgt_hist_em", "symbol": symbol, "ok": True, "rows": len(hist_records)}
-                    )
-                vals = [_num_unit(x, ["当日成交净买额", "当日净流入", "净买额", "净流入"], 0.0) for x in hist_records]
-                vals = [x for x in vals if x != 0.0]
-                if vals:
-                    return vals[-60:]
-            except Exception:
-                if debug_info is not None:
-                    debug_info.setdefault("api_calls", []).append({"api": "stock_hsgt_hist_em", "symbol": symbol, "ok": False})
-    return []
-
-
-def _load_symbol_main_flow(symbol: str, end_dt: datetime, debug_info: dict[str, Any] | None = None) -> float:
+            vals, call = _load_hsgt_hist_series(symbol)
+            if debug_info is not None:
+                debug_info.setdefault("api_calls", []).append(call)
+            if len(vals):
+                return vals[-60:]
+    return np.zeros(0)
+
+
+def _load_symbol_main_flow(
+    symbol: str, end_dt: datetime, today: date, debug_info: dict[str, Any] | None = None
+) -> float:
     if ak is None or pd is None:
         return 0.0
 
+    # The rank table is a live snapshot, so it can only answer for today's session.
+    live = end_dt.date() >= today
+    if live:
+        row = _load_rank_index("今日", debug_info).get(symbol)
+        if row is not None:
+            return _num_unit(row, _RANK_FLOW_KEYS, 0.0)
+
     try:
-        start = (end_dt - timedelta(days=15)).strftime("%Y%m%d")
-        end = end_dt.strftime("%Y%m%d")
-        hist = ak.stock_individual_fund_flow(symbol=symbol, start_date=start, end_date=end)
-        records = _to_records(hist)
+        start, end = _date_window(end_dt.date())
+        hist = _fetch_individual_fund_flow(symbol=symbol, start_date=start, end_date=end)
+        rows = _frame_len(hist)
         if debug_info is not None:
             debug_info.setdefault("api_calls", []).append(
-                {"api": "stock_individual_fund_flow", "symbol": symbol, "ok": True, "rows": len(records)}
+                {"api": "stock_individual_fund_flow", "symbol": symbol, "ok": True, "rows": rows}
             )
-        if records:
-            latest = records[-1]
-            return _num_unit(latest, ["主力净流入-净额", "主力净额", "主力净流入", "主力净流入净额"], 0.0)
+        if rows:
+            # Only the latest day is used; convert just that row.
+            return _num_unit(hist.tail(1).to_dict(orient="records")[0], _MAIN_KEYS, 0.0)
     except Exception:
         if debug_info is not None:
             debug_info.setdefault("api_calls", []).append({"api": "stock_individual_fund_flow", "symbol": symbol, "ok": False})
 
     if hasattr(ak, "stock_individual_fund_flow_rank"):
         for indicator in ("今日", "5日", "10日"):
-            try:
-                rank_df = ak.stock_individual_fund_flow_rank(indicator=indicator)
-                rows = _to_records(rank_df)
-                if debug_info is not None:
-                    debug_info.setdefault("api_calls", []).append(
-                        {"api": "stock_individual_fund_flow_rank", "indicator": indicator, "ok": True, "rows": len(rows)}
-                    )
-                for row in rows:
-                    code = str(row.get("股票代码", row.get("代码", ""))).strip()
-                    if code == symbol:
-                        return _num_unit(row, ["今日主力净流入-净额", "主力净流入-净额", "主力净额"], 0.0)
-            except Exception:
-                if debug_info is not None:
-                    debug_info.setdefault("api_calls", []).append(
-                        {"api": "stock_individual_fund_flow_rank", "indicator": indicator, "ok": False}
-                    )
+            if live and indicator == "今日":
+                continue
+            row = _load_rank_index(indicator, debug_info).get(symbol)
+            if row is not None:
+                return _num_unit(row, _RANK_FLOW_KEYS, 0.0)
     return 0.0
 
 
-def analyze_capital_flow(symbol: str | None = None, analysis_date: str | None = None, debug: bool = False) -> Dict[str, Any]:
-    debug = resolve_debug(debug)
+def _compute_capital_flow(symbol: str | None, analysis_date: str | None, debug: bool, today: date) -> Dict[str, Any]:
     fallback_ok = is_fallback_enabled(default=False)
-    analysis_ymd, analysis_dt = _parse_analysis_date(analysis_date)
+    analysis_ymd, analysis_dt = _parse_analysis_date(analysis_date, today)
     dbg: dict[str, Any] = {
         "module": "analyze_capital_flow",
         "analysis_date": analysis_ymd,
@@ -208,8 +299,22 @@ def analyze_capital_flow(symbol: str | None = None, analysis_date: str | None =
             dbg,
         )
 
-    north_vals = _load_northbound_series(debug_info=dbg)
-    if not north_vals:
+    # Northbound and symbol flow hit independent endpoints; overlap the two waits. Each
+    # loader gets its own debug dict, merged in a fixed order once both are done.
+    north_dbg: dict[str, Any] = {"api_calls": []}
+    flow_dbg: dict[str, Any] = {"api_calls": []}
+    symbol_flow = 0.0
+    if symbol:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            north_future = executor.submit(_load_northbound_series, debug_info=north_dbg)
+            flow_future = executor.submit(_load_symbol_main_flow, symbol, end_dt=analysis_dt, today=today, debug_info=flow_dbg)
+            north_vals = north_future.result()
+            symbol_flow = flow_future.result()
+    else:
+        north_vals = _load_northbound_series(debug_info=north_dbg)
+    dbg["api_calls"].extend(north_dbg["api_calls"] + flow_dbg["api_calls"])
+
+    if not len(north_vals):
         dbg["fallback_reason"] = "northbound_series_empty"
         return _fallback_capital_flow(symbol, debug=debug, debug_info=dbg) if fallback_ok else with_debug(
             {
@@ -228,14 +333,14 @@ def analyze_capital_flow(symbol: str | None = None, analysis_date: str | None =
 
     # Series endpoints generally return latest values; for historical date we approximate by taking
     # trailing sequence and selecting value by relative position.
-    northbound_net = north_vals[-1]
-    if analysis_date and analysis_dt.date() < datetime.now().date() and len(north_vals) >= 2:
-        days_back = max(0, (datetime.now().date() - analysis_dt.date()).days)
+    northbound_net = float(north_vals[-1])
+    if analysis_date and analysis_dt.date() < today and len(north_vals) >= 2:
+        days_back = max(0, (today - analysis_dt.date()).days)
         idx = max(0, len(north_vals) - 1 - days_back)
-        northbound_net = north_vals[idx]
+        northbound_net = float(north_vals[idx])
 
     northbound_inflow_days = _count_consecutive_inflow(north_vals)
-    main_flow = _load_symbol_main_flow(symbol, end_dt=analysis_dt, debug_info=dbg) if symbol else northbound_net * 0.55
+    main_flow = symbol_flow if symbol else northbound_net * 0.55
 
     if main_flow >= 300_000_000:
         strength_rank = 5
@@ -259,3 +364,43 @@ def analyze_capital_flow(symbol: str | None = None, analysis_date: str | None =
     }
     dbg["derived"] = {"north_series_points": len(north_vals)}
     return with_debug(payload, debug, dbg)
+
+
+class _UncachedResult(Exception):
+    """Carries a fallback/unavailable payload out of the memo so it is not stored."""
+
+    def __init__(self, result: Dict[str, Any]) -> None:
+        super().__init__()
+        self.result = result
+
+
+def _capital_flow_bucket(analysis_ymd: str, today: date) -> str:
+    # Live session data is reused within the same minute. Outside the session the key is the
+    # last close, so a pre-open result is not served after that day's close.
+    now = datetime.now()
+    if analysis_ymd >= today.strftime("%Y%m%d") and in_trading_session(now):
+        return f"{now:%Y%m%d%H%M}"
+    return f"close-{last_session_close(now):%Y%m%d%H%M}"
+
+
+@functools.lru_cache(maxsize=512)
+def _analyze_capital_flow_cached(symbol: str | None, analysis_ymd: str, today: date, bucket: str) -> Dict[str, Any]:
+    result = _compute_capital_flow(symbol, analysis_ymd, debug=False, today=today)
+    if result.get("data_source") != "akshare-live":
+        raise _UncachedResult(result)
+    return result
+
+
+def analyze_capital_flow(
+    symbol: str | None = None, analysis_date: str | None = None, debug: bool = False, today: date | None = None
+) -> Dict[str, Any]:
+    debug = resolve_debug(debug)
+    today = today or datetime.now().date()
+    # Debug runs always fetch so debug_info describes real calls, not a memo hit.
+    if debug or not is_cache_enabled():
+        return _compute_capital_flow(symbol, analysis_date, debug=debug, today=today)
+    analysis_ymd, _ = _parse_analysis_date(analysis_date, today)
+    try:
+        return dict(_analyze_capital_flow_cached(symbol, analysis_ymd, today, _capital_flow_bucket(analysis_ymd, today)))
+    except _UncachedResult as exc:
+        return exc.result
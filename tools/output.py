@@ -0,0 +1,20 @@
+﻿"""Output shaping shared by every place that serializes tool results."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Candidate metrics stay full precision for scoring; they are rounded only when emitted.
+OUTPUT_DIGITS = {"change_pct": 2, "volume_ratio": 2}
+
+
+def round_output(data: Any) -> Any:
+    """Copy of `data` with the `OUTPUT_DIGITS` keys rounded at any depth."""
+    if isinstance(data, dict):
+        return {
+            key: round(value, OUTPUT_DIGITS[key]) if key in OUTPUT_DIGITS and isinstance(value, float) else round_output(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [round_output(item) for item in data]
+    return data
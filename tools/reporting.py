@@ -7,6 +7,23 @@ from typing import Any, Dict, List
 from .debug_utils import resolve_debug
 from .fusion_engine import short_term_signal_engine
 
+# Report layout; generate_daily_report fills it with format_map from a flat mapping.
+_REPORT_TMPL = (
+    "【A股短线日报】\n\n"
+    "分析日期：{analysis_date}\n"
+    "市场情绪：score={score} (涨停{limit_up} 跌停{limit_down} 炸板率{break_rate})\n"
+    "最高连板：{max_height}\n\n"
+    "强势板块：\n{sectors}\n\n"
+    "短线关注：\n{candidates}\n\n"
+    "结论：\n{conclusion}\n\n"
+    "建议：\n"
+    "轻仓试错(<= {max_position_pct}%)\n"
+    "止损 {stop_loss}%\n"
+    "止盈 {take_profit}%\n\n"
+    "风险：\n"
+    "{risk_note}"
+)
+
 
 def _fmt_sectors(sectors: List[dict[str, Any]]) -> str:
     if not sectors:
@@ -22,37 +39,38 @@ def _fmt_candidates(cands: List[dict[str, Any]]) -> str:
         return "暂无"
     lines = []
     for item in cands[:3]:
-        lines.append(
-            f"{item.get('code', '')} {item.get('name', '')} | "
-            f"chg {item.get('change_pct', 0)}% | vol {item.get('volume_ratio', 0)}x"
-        )
+        chg = round(float(item.get("change_pct", 0)), 2)
+        vol = round(float(item.get("volume_ratio", 0)), 2)
+        lines.append(f"{item.get('code', '')} {item.get('name', '')} | chg {chg}% | vol {vol}x")
     return "\n".join(lines)
 
 
 def generate_daily_report(analysis_date: str | None = None, debug: bool = False) -> Dict[str, Any]:
     debug = resolve_debug(debug)
-    signal = short_term_signal_engine(analysis_date=analysis_date, debug=debug)
+    # The report lists boards and picks even on NO_TRADE days, so never take the early exit.
+    signal = short_term_signal_engine(analysis_date=analysis_date, debug=debug, force_full=True)
     m = signal["market_sentiment"]
     sectors = signal["top_sectors"]
     cands = signal["candidates"]
     risk = signal["risk_control"]
     friendly = signal.get("no_recommendation_message", "当前暂无推荐标的，建议观望。")
 
-    report = (
-        "【A股短线日报】\n\n"
-        f"分析日期：{signal.get('analysis_date', m.get('date', ''))}\n"
-        f"市场情绪：score={m.get('market_sentiment_score', 0)} "
-        f"(涨停{m.get('limit_up', 0)} 跌停{m.get('limit_down', 0)} 炸板率{m.get('break_rate', 0)})\n"
-        f"最高连板：{m.get('max_height', 0)}\n\n"
-        f"强势板块：\n{_fmt_sectors(sectors)}\n\n"
-        f"短线关注：\n{_fmt_candidates(cands)}\n\n"
-        f"结论：\n{friendly}\n\n"
-        "建议：\n"
-        f"轻仓试错(<= {int(risk.get('max_position', 0) * 100)}%)\n"
-        f"止损 {risk.get('stop_loss', -6)}%\n"
-        f"止盈 {risk.get('take_profit', 12)}%\n\n"
-        "风险：\n"
-        f"{risk.get('risk_note', '')}"
+    report = _REPORT_TMPL.format_map(
+        {
+            "analysis_date": signal.get("analysis_date", m.get("date", "")),
+            "score": m.get("market_sentiment_score", 0),
+            "limit_up": m.get("limit_up", 0),
+            "limit_down": m.get("limit_down", 0),
+            "break_rate": m.get("break_rate", 0),
+            "max_height": m.get("max_height", 0),
+            "sectors": _fmt_sectors(sectors),
+            "candidates": _fmt_candidates(cands),
+            "conclusion": friendly,
+            "max_position_pct": int(risk.get("max_position", 0) * 100),
+            "stop_loss": risk.get("stop_loss", -6),
+            "take_profit": risk.get("take_profit", 12),
+            "risk_note": risk.get("risk_note", ""),
+        }
     )
 
     return {